@@ -11,9 +11,12 @@
 변경 내역:
 - 2026-01-12 [김준서(C1098)]: 초기 버전 생성 (부서별 평균 급여 계산 기능)
 - 2026-01-12 [김준서(C1098)]: 함수 로직 간소화 및 최적화
+- 2026-10-18 [김준서(C1098)]: 공용 계측 데코레이터 적용 (profiling_hooks)
 ================================================================================
 """
 
+from profiling_hooks import instrument
+
 # 직원 데이터 정의
 employees = [
     {"name": "Alice", "department": "Engineering", "age": 30, "salary": 85000},
@@ -27,6 +30,7 @@ employees = [
 # 모든 부서별 평균 급여를 계산하여 딕셔너리 형태로 반환합니다.
 # Args: employee_list (list) - 직원 정보를 담은 딕셔너리 리스트
 # Returns: dict - {부서명: 평균급여} 형태의 딕셔너리
+@instrument
 def get_average_salary_by_department(employee_list):
     result = {}
     for dept in set(emp["department"] for emp in employee_list):
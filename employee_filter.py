@@ -13,9 +13,14 @@
 
 작성일: 2026년 1월 12일
 작성자: 김준서(C1098)
+
+변경 내역:
+- 2026-10-18 [김준서(C1098)]: 필터링/분석 함수에 공용 계측 데코레이터 적용 (profiling_hooks)
 ================================================================================
 """
 
+from profiling_hooks import instrument
+
 # 직원 데이터 정의
 employees = [
     {"name": "Alice", "department": "Engineering", "age": 30, "salary": 85000},
@@ -29,6 +34,7 @@ employees = [
 # 부서가 "Engineering"이고 급여가 80000 이상인 직원들의 이름을 반환합니다.
 # Args: employee_list (list) - 직원 정보를 담은 딕셔너리 리스트
 # Returns: list - 조건을 만족하는 직원들의 이름 리스트
+@instrument
 def filter_engineering_high_salary(employee_list):
     result = [
         emp["name"] 
@@ -42,6 +48,7 @@ def filter_engineering_high_salary(employee_list):
 # Args: employee_list (list) - 직원 정보를 담은 딕셔너리 리스트
 #       min_age (int) - 최소 나이 기준 (기본값: 30)
 # Returns: list - (이름, 부서) 튜플을 담은 리스트
+@instrument
 def get_employees_over_age(employee_list, min_age=30):
     result = [
         (emp["name"], emp["department"]) 
@@ -55,6 +62,7 @@ def get_employees_over_age(employee_list, min_age=30):
 # Args: employee_list (list) - 직원 정보를 담은 딕셔너리 리스트
 #       top_n (int) - 상위 몇 명을 반환할지 지정 (기본값: 3)
 # Returns: list - (이름, 급여) 튜플을 담은 리스트 (급여 내림차순)
+@instrument
 def get_top_salaries(employee_list, top_n=3):
     # 급여 기준으로 내림차순 정렬
     sorted_employees = sorted(
@@ -74,6 +82,7 @@ def get_top_salaries(employee_list, top_n=3):
 # 모든 부서별 평균 급여를 계산하여 딕셔너리 형태로 반환합니다.
 # Args: employee_list (list) - 직원 정보를 담은 딕셔너리 리스트
 # Returns: dict - {부서명: 평균급여} 형태의 딕셔너리
+@instrument
 def get_average_salary_by_department(employee_list):
     # 1단계: 부서별로 급여 합계와 인원 수를 저장할 딕셔너리 생성
     # 예: {"Engineering": {"total": 258000, "count": 3}, ...}
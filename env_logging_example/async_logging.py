@@ -0,0 +1,331 @@
+"""
+비동기(큐 기반) 로깅 파이프라인 모듈
+
+이 모듈은 QueueHandler / QueueListener를 사용하여 로그 호출 스레드가 디스크나 터미널 I/O를
+기다리지 않도록 하는 비동기 로깅 구성을 제공합니다. main.py의 setup_logging에서 선택적으로
+사용합니다.
+
+주요 기능:
+- 크기 제한이 있는 큐(bounded queue)와 오버플로 정책 (block, drop, sample)
+- 배치 단위 flush (batch_size개 또는 flush_interval초마다 한 번)
+- 크기(size) / 시간(time) 기반 로그 파일 로테이션
+- 종료 시(atexit) 큐에 남은 로그를 모두 기록하고 핸들러를 정리
+
+환경 변수 (.env):
+- LOG_ASYNC: "true"이면 비동기 모드 사용 (기본값: false)
+- LOG_QUEUE_SIZE: 큐 최대 크기 (기본값: 10000)
+- LOG_OVERFLOW: 큐가 가득 찼을 때의 정책 - block, drop, sample (기본값: block)
+- LOG_SAMPLE_RATE: sample 정책에서 N개 중 1개만 기록 (기본값: 10)
+- LOG_BATCH_SIZE: 한 번에 처리 후 flush할 최대 레코드 수 (기본값: 256)
+- LOG_FLUSH_INTERVAL: 배치 flush 최대 간격(초) (기본값: 0.2)
+- LOG_ROTATION: 파일 로테이션 방식 - none, size, time (기본값: none)
+- LOG_MAX_BYTES: size 로테이션 기준 파일 크기 (기본값: 10MB)
+- LOG_ROTATE_WHEN: time 로테이션 주기 (기본값: midnight)
+- LOG_BACKUP_COUNT: 보관할 백업 파일 수 (기본값: 5)
+
+변경 내역:
+- 2026-10-18 [김준서(C1098)]: 초기 버전 생성 (큐 기반 비동기 로깅 파이프라인)
+- 2026-10-18 [김준서(C1098)]: 큐에 넣을 때 예외 정보를 메시지에 합치지 않고 exc_text로 유지 (JSON 포맷 일관성)
+"""
+
+import atexit
+import copy
+import logging
+import logging.handlers
+import os
+import queue
+import time
+from typing import Dict, List, Optional
+
+
+# 지원하는 오버플로 정책 및 로테이션 방식
+OVERFLOW_POLICIES = ['block', 'drop', 'sample']
+ROTATION_MODES = ['none', 'size', 'time']
+
+# 큐에 넣기 전에 예외 트레이스백을 문자열로 만들 때 사용하는 기본 포맷터
+_exc_formatter = logging.Formatter()
+
+# 현재 실행 중인 리스너 (setup_logging 재호출 및 종료 처리용)
+_active_listener: Optional["BatchingQueueListener"] = None
+
+
+# 배치 flush 믹스인: emit마다 flush하지 않고, 리스너가 배치 끝에서 flush_now()를 호출합니다.
+class _BatchFlushMixin:
+    def flush(self):
+        # 레코드마다 호출되는 flush는 생략 (스트림 버퍼에 모아둠)
+        pass
+
+    def flush_now(self):
+        super().flush()
+
+
+# 배치 flush를 사용하는 핸들러들 (콘솔 / 일반 파일 / 크기 로테이션 / 시간 로테이션)
+class BatchStreamHandler(_BatchFlushMixin, logging.StreamHandler):
+    pass
+
+
+class BatchFileHandler(_BatchFlushMixin, logging.FileHandler):
+    pass
+
+
+# 크기 로테이션 핸들러: 기본 shouldRollover는 레코드마다 stream.seek()/tell()을 호출하여 버퍼를 flush하므로,
+# 파일 크기를 직접 누적(열 때의 크기 + 기록한 메시지의 바이트 수)하여 배치 flush가 유지되도록 합니다.
+class BatchRotatingFileHandler(_BatchFlushMixin, logging.handlers.RotatingFileHandler):
+    _size = 0
+
+    def _open(self):
+        stream = super()._open()
+        self._size = os.path.getsize(self.baseFilename)
+        return stream
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            msg = self.format(record) + self.terminator
+            size = len(msg.encode(self.encoding or 'utf-8'))
+            if self.maxBytes > 0 and self._size > 0 and self._size + size >= self.maxBytes:
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BatchTimedRotatingFileHandler(_BatchFlushMixin, logging.handlers.TimedRotatingFileHandler):
+    pass
+
+
+# 오버플로 정책을 적용하는 QueueHandler
+# - block: 큐에 자리가 날 때까지 호출 스레드가 대기 (로그 유실 없음)
+# - drop: 큐가 가득 차면 해당 레코드를 버림
+# - sample: 큐가 sample_threshold 이상 차면 sample_rate개 중 1개만 넣고, 가득 차면 버림
+# WARNING 이상 레코드는 정책과 관계없이 유실되지 않도록 항상 block 방식으로 넣습니다.
+class OverflowQueueHandler(logging.handlers.QueueHandler):
+    def __init__(self, log_queue: queue.Queue, overflow: str = 'block',
+                 sample_rate: int = 10, sample_threshold: float = 0.8):
+        super().__init__(log_queue)
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"지원하지 않는 오버플로 정책입니다: {overflow} (가능: {OVERFLOW_POLICIES})")
+        self.overflow = overflow
+        self.sample_rate = max(1, sample_rate)
+        self.sample_watermark = int(log_queue.maxsize * sample_threshold) if log_queue.maxsize > 0 else 0
+        self.dropped = 0
+        self._sample_counter = 0
+
+    # 기본 prepare는 트레이스백을 message에 합치고 exc_info/exc_text를 지우므로, 리스너 쪽 포맷터(JsonFormatter 등)가
+    # 동기 모드와 같은 형태로 출력할 수 있도록 메시지만 확정하고 트레이스백은 exc_text로 남겨둡니다.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        message = record.getMessage()
+        record.message = message
+        record.msg = message
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _exc_formatter.formatException(record.exc_info)
+        # 트레이스백 객체는 프레임을 붙잡고 있으므로 큐에는 문자열(exc_text)만 넘김
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        if self.overflow == 'block' or record.levelno >= logging.WARNING:
+            self.queue.put(record)
+            return
+
+        # 카운터는 여러 스레드에서 갱신되므로 핸들러 락(RLock)으로 보호
+        if self.overflow == 'sample' and self.sample_watermark and self.queue.qsize() >= self.sample_watermark:
+            with self.lock:
+                self._sample_counter += 1
+                skip = self._sample_counter % self.sample_rate
+                if skip:
+                    self.dropped += 1
+            if skip:
+                return
+
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+
+
+# 배치 처리 QueueListener: 레코드를 최대 batch_size개 또는 flush_interval초 동안 모아 처리한 뒤
+# 핸들러를 한 번만 flush합니다.
+# logger / queue_handler는 종료 시 큐 핸들러를 붙였던 로거에서 떼어내기 위해 보관합니다.
+class BatchingQueueListener(logging.handlers.QueueListener):
+    def __init__(self, log_queue: queue.Queue, *handlers: logging.Handler,
+                 logger: logging.Logger, queue_handler: OverflowQueueHandler,
+                 batch_size: int = 256, flush_interval: float = 0.2):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.logger = logger
+        self.queue_handler = queue_handler
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+    # 종료 신호(sentinel)는 큐가 가득 차 있어도 반드시 들어가야 하므로 block 방식으로 넣음
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+    def _flush_handlers(self):
+        for handler in self.handlers:
+            if isinstance(handler, _BatchFlushMixin):
+                handler.flush_now()
+            else:
+                handler.flush()
+
+    def _monitor(self):
+        q = self.queue
+        while True:
+            # 첫 레코드는 올 때까지 대기
+            record = q.get()
+            deadline = time.monotonic() + self.flush_interval
+            count = 0
+            stop = False
+
+            while True:
+                if record is self._sentinel:
+                    q.task_done()
+                    stop = True
+                    break
+                self.handle(record)
+                q.task_done()
+                count += 1
+                if count >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    record = q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            self._flush_handlers()
+            if stop:
+                break
+
+
+# 문자열 환경 변수를 bool로 변환하는 헬퍼 함수
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+# 환경 변수에서 비동기 로깅 옵션을 읽어오는 함수
+# Returns: Dict - setup_logging의 async_options로 전달할 옵션 딕셔너리 (LOG_ASYNC가 꺼져 있으면 None)
+def load_async_options() -> Optional[Dict[str, any]]:
+    if not _env_bool("LOG_ASYNC", False):
+        return None
+    return {
+        'queue_size': int(os.getenv("LOG_QUEUE_SIZE", "10000")),
+        'overflow': os.getenv("LOG_OVERFLOW", "block").lower(),
+        'sample_rate': int(os.getenv("LOG_SAMPLE_RATE", "10")),
+        'batch_size': int(os.getenv("LOG_BATCH_SIZE", "256")),
+        'flush_interval': float(os.getenv("LOG_FLUSH_INTERVAL", "0.2")),
+        'rotation': os.getenv("LOG_ROTATION", "none").lower(),
+        'max_bytes': int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024))),
+        'rotate_when': os.getenv("LOG_ROTATE_WHEN", "midnight"),
+        'backup_count': int(os.getenv("LOG_BACKUP_COUNT", "5")),
+    }
+
+
+# 로테이션 방식에 맞는 배치 flush 파일 핸들러를 생성하는 함수
+# Args: log_file (str) - 로그 파일 경로
+#       options (Dict) - 비동기 로깅 옵션
+# Returns: logging.Handler - 파일 핸들러
+def _create_file_handler(log_file: str, options: Dict[str, any]) -> logging.Handler:
+    rotation = options.get('rotation', 'none')
+    if rotation == 'size':
+        return BatchRotatingFileHandler(
+            log_file,
+            maxBytes=options.get('max_bytes', 10 * 1024 * 1024),
+            backupCount=options.get('backup_count', 5),
+            encoding="utf-8",
+        )
+    if rotation == 'time':
+        return BatchTimedRotatingFileHandler(
+            log_file,
+            when=options.get('rotate_when', 'midnight'),
+            backupCount=options.get('backup_count', 5),
+            encoding="utf-8",
+        )
+    if rotation != 'none':
+        raise ValueError(f"지원하지 않는 로테이션 방식입니다: {rotation} (가능: {ROTATION_MODES})")
+    return BatchFileHandler(log_file, encoding="utf-8")
+
+
+# 비동기 로깅 파이프라인을 구성하고 리스너를 시작하는 함수
+# Args: logger (logging.Logger) - 큐 핸들러를 붙일 로거 (보통 루트 로거)
+#       level (int) - 로그 레벨
+#       formatter (logging.Formatter) - 콘솔/파일 핸들러에 적용할 포맷터
+#       log_file (str) - 로그 파일 경로
+#       options (Dict) - 비동기 로깅 옵션 (load_async_options 참고)
+# Returns: BatchingQueueListener - 시작된 리스너
+def start_async_logging(logger: logging.Logger, level: int, formatter: logging.Formatter,
+                        log_file: str, options: Dict[str, any]) -> BatchingQueueListener:
+    global _active_listener
+    shutdown_async_logging()
+
+    # 실제 I/O를 담당하는 핸들러 (리스너 스레드에서만 호출됨)
+    handlers: List[logging.Handler] = [BatchStreamHandler(), _create_file_handler(log_file, options)]
+    for handler in handlers:
+        handler.setLevel(level)
+        handler.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=options.get('queue_size', 10000))
+    queue_handler = OverflowQueueHandler(
+        log_queue,
+        overflow=options.get('overflow', 'block'),
+        sample_rate=options.get('sample_rate', 10),
+    )
+    queue_handler.setLevel(level)
+    logger.addHandler(queue_handler)
+
+    listener = BatchingQueueListener(
+        log_queue,
+        *handlers,
+        logger=logger,
+        queue_handler=queue_handler,
+        batch_size=options.get('batch_size', 256),
+        flush_interval=options.get('flush_interval', 0.2),
+    )
+    listener.start()
+    _active_listener = listener
+    return listener
+
+
+# 실행 중인 비동기 로깅 리스너를 종료하는 함수
+# 큐에 남은 레코드를 모두 기록하고, 버려진 레코드가 있으면 그 개수를 마지막 로그로 남긴 뒤 핸들러를 닫습니다.
+def shutdown_async_logging() -> None:
+    global _active_listener
+    listener = _active_listener
+    if listener is None:
+        return
+    _active_listener = None
+
+    queue_handler = listener.queue_handler
+    listener.logger.removeHandler(queue_handler)
+    listener.stop()
+
+    if queue_handler.dropped:
+        record = logging.makeLogRecord({
+            'name': __name__,
+            'levelno': logging.WARNING,
+            'levelname': 'WARNING',
+            'msg': f"오버플로 정책({queue_handler.overflow})으로 로그 {queue_handler.dropped}개가 버려졌습니다.",
+        })
+        for handler in listener.handlers:
+            handler.handle(record)
+
+    for handler in listener.handlers:
+        if isinstance(handler, _BatchFlushMixin):
+            handler.flush_now()
+        handler.close()
+
+
+# 프로그램 종료 시 큐에 남은 로그를 모두 기록
+atexit.register(shutdown_async_logging)
@@ -0,0 +1,172 @@
+"""
+구조화(JSON) 로그 포맷터 및 지연 평가 key/value 로깅 헬퍼 모듈
+
+이 모듈은 로그 레코드를 한 줄의 JSON으로 출력하는 빠른 포맷터와, 비활성화된 레벨에서는
+아무 작업도 하지 않는 key/value 로깅 헬퍼를 제공합니다. main.py의 setup_logging에서
+LOG_FORMAT=json일 때 사용합니다.
+
+주요 기능:
+- 타임스탬프 문자열을 초 단위로 캐시하는 JsonFormatter (밀리초만 매번 덧붙임)
+- extra 필드를 중간 딕셔너리 없이 레코드 속성에서 바로 JSON 문자열 조각으로 직렬화
+- debug_kv / info_kv / warning_kv / error_kv: 레벨이 꺼져 있으면 레코드 생성 전에 바로 반환
+- callable 필드 값은 레벨이 활성화된 경우에만 호출 (지연 평가)
+- filename, name, lineno 등 LogRecord 속성과 같은 이름의 필드도 그대로 사용 가능
+- KeyValueTextFormatter: text 포맷(LOG_FORMAT=text)에서도 kv 필드를 메시지 뒤에 key=value로 출력
+  (kv 필드는 이 모듈의 두 포맷터만 출력하며, 일반 logging.Formatter에서는 표시되지 않음)
+
+사용 예:
+    info_kv(logger, "user_login", user_id=42, ip="127.0.0.1")
+    debug_kv(logger, "payload", body=lambda: build_expensive_dump())  # DEBUG가 꺼져 있으면 호출되지 않음
+    # {"ts": "2026-10-18T12:00:00.123", "level": "INFO", "logger": "app", "message": "user_login", "user_id": 42, "ip": "127.0.0.1"}
+
+변경 내역:
+- 2026-10-18 [김준서(C1098)]: 초기 버전 생성 (JSON 포맷터 및 지연 평가 key/value 로깅 헬퍼)
+- 2026-10-18 [김준서(C1098)]: kv 필드를 네임스페이스 속성으로 전달 (LogRecord 속성명 충돌 해결), callable 값 지연 평가
+- 2026-10-18 [김준서(C1098)]: 일반 extra 필드도 출력 키와 겹치면 field_ 접두사 적용, text 포맷용 KeyValueTextFormatter 추가
+"""
+
+import json
+import logging
+import time
+from json.encoder import encode_basestring
+from typing import Dict
+
+
+# kv 헬퍼가 필드 딕셔너리를 담아 넘기는 LogRecord 속성 이름 (JsonFormatter가 최상위 필드로 펼침)
+KV_FIELDS_ATTR = 'kv_fields'
+
+# LogRecord가 기본으로 가지는 속성 이름 (이 외의 속성은 extra 필드로 간주하여 출력)
+_RESERVED_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {'message', 'asctime', 'taskName'}
+
+# JsonFormatter가 직접 출력하는 키 (extra / kv 필드 이름이 겹치면 "field_" 접두사를 붙여 중복 키를 피함)
+_OUTPUT_KEYS = frozenset({'ts', 'level', 'logger', 'message', 'exc_info', 'stack_info'})
+
+# 문자열이 아닌 extra 값을 직렬화할 인코더 (직렬화할 수 없는 객체는 str()로 변환)
+_encode_other = json.JSONEncoder(ensure_ascii=False, default=str).encode
+
+
+# extra 필드 값 하나를 JSON 문자열 조각으로 변환하는 함수
+# Args: value - 직렬화할 값
+# Returns: str - JSON 문자열 조각
+def _encode_value(value) -> str:
+    if isinstance(value, str):
+        return encode_basestring(value)
+    return _encode_other(value)
+
+
+# extra / kv 필드 하나를 ', "key": value' 형태의 조각으로 parts에 추가하는 함수
+# 출력 키(ts, level, message 등)와 이름이 겹치면 "field_" 접두사를 붙여 JSON 중복 키를 방지합니다.
+# Args: parts (list) - 출력 문자열 조각 리스트
+#       key (str) - 필드 이름
+#       value - 필드 값
+def _append_field(parts: list, key: str, value) -> None:
+    if key in _OUTPUT_KEYS:
+        key = 'field_' + key
+    parts.append(', ')
+    parts.append(encode_basestring(key))
+    parts.append(': ')
+    parts.append(_encode_value(value))
+
+
+# 구조화 JSON 로그 포맷터: 레코드 하나를 한 줄의 JSON 객체 문자열로 변환합니다.
+class JsonFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__()
+        # (초, "YYYY-mm-ddTHH:MM:SS") 튜플 하나로 저장하여 여러 스레드에서도 짝이 어긋나지 않도록 함
+        self._ts_cache = (None, '')
+
+    # 타임스탬프를 포맷하는 메서드 (같은 초 안에서는 캐시된 문자열 재사용)
+    # Args: created (float) - record.created (epoch 초)
+    # Returns: str - "YYYY-mm-ddTHH:MM:SS.mmm" 형식 문자열
+    def _format_timestamp(self, created: float) -> str:
+        second = int(created)
+        cached_second, prefix = self._ts_cache
+        if cached_second != second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", self.converter(second))
+            self._ts_cache = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1000):03d}"
+
+    def format(self, record: logging.LogRecord) -> str:
+        parts = [
+            '{"ts": "', self._format_timestamp(record.created),
+            '", "level": "', record.levelname,
+            '", "logger": ', encode_basestring(record.name),
+            ', "message": ', encode_basestring(record.getMessage()),
+        ]
+
+        # extra 필드: 레코드 속성을 직접 순회하며 문자열 조각으로 추가 (kv 필드는 최상위로 펼침)
+        for key, value in record.__dict__.items():
+            if key in _RESERVED_ATTRS:
+                continue
+            if key == KV_FIELDS_ATTR and isinstance(value, dict):
+                for field, field_value in value.items():
+                    _append_field(parts, field, field_value)
+                continue
+            _append_field(parts, key, value)
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            parts.append(', "exc_info": ')
+            parts.append(encode_basestring(record.exc_text))
+        if record.stack_info:
+            parts.append(', "stack_info": ')
+            parts.append(encode_basestring(self.formatStack(record.stack_info)))
+
+        parts.append('}')
+        return ''.join(parts)
+
+
+# text 포맷용 key/value 포맷터: 기존 포맷 문자열을 그대로 쓰되, kv 헬퍼로 넘긴 필드를
+# 메시지 뒤에 " key=value" 형태로 덧붙입니다. (공백이나 따옴표가 있는 문자열 값은 JSON 문자열로 감쌈)
+class KeyValueTextFormatter(logging.Formatter):
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        fields = record.__dict__.get(KV_FIELDS_ATTR)
+        if fields:
+            pairs = []
+            for key, value in fields.items():
+                if isinstance(value, str) and (not value or any(ch.isspace() or ch in '"=' for ch in value)):
+                    value = encode_basestring(value)
+                pairs.append(f"{key}={value}")
+            record.message = f"{record.message} {' '.join(pairs)}"
+        return super().formatMessage(record)
+
+
+# key/value 로그 공통 구현: 레벨이 비활성화되어 있으면 아무 작업 없이 바로 반환합니다.
+# 호출 가능한(callable) 값은 레벨 검사를 통과한 뒤에만 호출하여 그 결과를 기록합니다.
+# 필드는 LogRecord 속성과 이름이 겹치지 않도록 KV_FIELDS_ATTR 속성 하나에 담아 넘깁니다.
+def _log_kv(logger: logging.Logger, level: int, event: str, fields: Dict[str, any]) -> None:
+    if not logger.isEnabledFor(level):
+        return
+    for key, value in fields.items():
+        if callable(value):
+            fields[key] = value()
+    # stacklevel=3: 헬퍼 함수가 아니라 실제 호출 위치가 funcName/lineno로 기록되도록 함
+    logger.log(level, event, extra={KV_FIELDS_ATTR: fields}, stacklevel=3)
+
+
+# key/value 로그를 기록하는 함수
+# Args: logger (logging.Logger) - 사용할 로거
+#       level (int) - 로그 레벨
+#       event (str) - 이벤트 이름 (message 필드로 출력)
+#       fields - 출력할 key/value (callable 값은 레벨이 활성화된 경우에만 호출)
+# Returns: None
+def log_kv(logger: logging.Logger, level: int, event: str, **fields) -> None:
+    _log_kv(logger, level, event, fields)
+
+
+# 레벨별 key/value 로깅 헬퍼: log_kv와 같으며 레벨만 고정되어 있습니다.
+def debug_kv(logger: logging.Logger, event: str, **fields) -> None:
+    _log_kv(logger, logging.DEBUG, event, fields)
+
+
+def info_kv(logger: logging.Logger, event: str, **fields) -> None:
+    _log_kv(logger, logging.INFO, event, fields)
+
+
+def warning_kv(logger: logging.Logger, event: str, **fields) -> None:
+    _log_kv(logger, logging.WARNING, event, fields)
+
+
+def error_kv(logger: logging.Logger, event: str, **fields) -> None:
+    _log_kv(logger, logging.ERROR, event, fields)
@@ -0,0 +1,212 @@
+"""
+로깅 파이프라인 벤치마크 프로그램
+
+이 프로그램은 setup_logging의 기존 동기 방식(StreamHandler + FileHandler)과 큐 기반 비동기 방식의
+처리량(throughput)과 로그 호출 지연 시간(p50/p99)을 비교하고, 포맷터/호출 방식별 초당 레코드 수를
+측정합니다.
+
+주요 기능:
+- pipeline: 동기 / 비동기(block, drop, sample 정책) 구성별 logging.info 호출 지연 시간 측정
+- pipeline: 호출 스레드 기준 처리량과 종료(flush) 포함 전체 처리량 측정
+  (전체 처리량은 오버플로 정책으로 버려진 레코드를 제외한 실제 기록 수 기준)
+- formatter: 레벨 비활성화(disabled), 콘솔 전용, 파일 전용 구성에서 text / JSON 포맷터 및
+  f-string / %s 인자 / key-value 헬퍼 호출 방식별 records/sec 측정
+- 결과를 JSON 형태로 출력
+
+측정 중 콘솔 출력은 os.devnull로, 로그 파일은 임시 디렉토리에 기록됩니다.
+
+사용 예:
+    python logging_benchmark.py --records 100000
+    python logging_benchmark.py --suite formatter
+
+변경 내역:
+- 2026-10-18 [김준서(C1098)]: 초기 버전 생성 (동기 vs 비동기 로깅 처리량 및 p99 지연 시간 비교)
+- 2026-10-18 [김준서(C1098)]: 포맷터 마이크로벤치마크(formatter suite) 추가
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from async_logging import OverflowQueueHandler, shutdown_async_logging
+from json_logging import JsonFormatter, KeyValueTextFormatter, info_kv
+from main import setup_logging
+
+
+# 벤치마크할 구성 목록: (이름, 비동기 옵션)
+CONFIGURATIONS = [
+    ('sync', None),
+    ('async-block', {'overflow': 'block'}),
+    ('async-drop', {'overflow': 'drop'}),
+    ('async-sample', {'overflow': 'sample'}),
+]
+
+# 포맷터 마이크로벤치마크에서 측정할 호출 방식
+CALL_STYLES = ['fstring', 'args', 'kv']
+
+
+# 정렬된 리스트에서 백분위수 값을 구하는 함수
+# Args: sorted_values (List[int]) - 오름차순 정렬된 값 리스트
+#       percentile (float) - 백분위수 (0 ~ 100)
+# Returns: int - 해당 백분위수 값
+def _percentile(sorted_values: List[int], percentile: float) -> int:
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * percentile / 100))
+    return sorted_values[index]
+
+
+# 한 가지 구성으로 로그를 기록하면서 처리량과 지연 시간을 측정하는 함수
+# Args: records (int) - 기록할 로그 레코드 수
+#       async_options (Dict) - 비동기 옵션 (None이면 동기 방식)
+# Returns: Dict - 처리량, 지연 시간 백분위수 등 측정 결과
+def run_single(records: int, async_options: Optional[Dict[str, any]]) -> Dict[str, any]:
+    setup_logging("INFO", async_options)
+
+    latencies = [0] * records
+    start = time.perf_counter()
+    for i in range(records):
+        t0 = time.perf_counter_ns()
+        logging.info("benchmark record %d", i)
+        latencies[i] = time.perf_counter_ns() - t0
+    caller_elapsed = time.perf_counter() - start
+
+    # 오버플로 정책으로 버려진 레코드 수 (shutdown_async_logging이 큐 핸들러를 떼어내기 전에 확인)
+    dropped = sum(
+        handler.dropped for handler in logging.getLogger().handlers
+        if isinstance(handler, OverflowQueueHandler)
+    )
+    written = records - dropped
+
+    # 비동기 모드는 큐에 남은 레코드를 모두 기록할 때까지 포함하여 전체 시간 측정
+    shutdown_async_logging()
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+    total_elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        'records': records,
+        'dropped': dropped,
+        'written': written,
+        'caller_records_per_sec': round(records / caller_elapsed, 1),
+        'end_to_end_records_per_sec': round(written / total_elapsed, 1),
+        'latency_p50_us': round(_percentile(latencies, 50) / 1000, 2),
+        'latency_p99_us': round(_percentile(latencies, 99) / 1000, 2),
+        'latency_max_us': round(latencies[-1] / 1000, 2),
+    }
+
+
+# 모든 구성에 대해 벤치마크를 실행하는 함수
+# Args: records (int) - 구성별로 기록할 로그 레코드 수
+#       queue_size (int) - 비동기 모드의 큐 크기
+# Returns: Dict - {구성명: 측정 결과}
+def run_benchmark(records: int = 50000, queue_size: int = 10000) -> Dict[str, Dict[str, any]]:
+    results = {}
+    original_dir = os.getcwd()
+
+    with tempfile.TemporaryDirectory(prefix='logging_bench_') as work_dir, \
+            open(os.devnull, 'w', encoding='utf-8') as devnull:
+        # setup_logging이 만드는 app.log는 임시 디렉토리에, 콘솔 출력은 devnull로 보냄
+        os.chdir(work_dir)
+        try:
+            with contextlib.redirect_stderr(devnull):
+                for name, options in CONFIGURATIONS:
+                    if options is not None:
+                        options = dict(options, queue_size=queue_size)
+                    results[name] = run_single(records, options)
+                    root = logging.getLogger()
+                    for handler in root.handlers:
+                        handler.close()
+                    root.handlers.clear()
+        finally:
+            os.chdir(original_dir)
+
+    return results
+
+
+# 지정한 호출 방식으로 로그를 records번 기록하고 초당 레코드 수를 반환하는 함수
+# Args: logger (logging.Logger) - 사용할 로거
+#       style (str) - 호출 방식 ('fstring', 'args', 'kv')
+#       records (int) - 기록할 로그 레코드 수
+# Returns: float - records/sec
+def _measure_calls(logger: logging.Logger, style: str, records: int) -> float:
+    path = "/api/users"
+    start = time.perf_counter()
+    if style == 'fstring':
+        for i in range(records):
+            logger.info(f"request user_id={i} path={path}")
+    elif style == 'args':
+        for i in range(records):
+            logger.info("request user_id=%d path=%s", i, path)
+    else:
+        for i in range(records):
+            info_kv(logger, "request", user_id=i, path=path)
+    for handler in logger.handlers:
+        handler.flush()
+    return round(records / (time.perf_counter() - start), 1)
+
+
+# 포맷터 마이크로벤치마크: disabled / console-only / file-only 구성별 records/sec를 측정하는 함수
+# Args: records (int) - 구성별로 기록할 로그 레코드 수
+# Returns: Dict - {구성명: {호출 방식: records/sec}}
+def run_formatter_benchmark(records: int = 50000) -> Dict[str, Dict[str, float]]:
+    logger = logging.getLogger('logging_benchmark')
+    logger.propagate = False
+    results = {}
+
+    with tempfile.TemporaryDirectory(prefix='logging_bench_') as work_dir, \
+            open(os.devnull, 'w', encoding='utf-8') as devnull:
+        text_fmt = KeyValueTextFormatter("%(asctime)s | %(levelname)s | %(message)s")
+        json_fmt = JsonFormatter()
+
+        # (구성명, 핸들러 생성 함수, 포맷터, 로거 레벨)
+        configurations = [
+            ('disabled', None, None, logging.WARNING),
+            ('console-text', lambda: logging.StreamHandler(devnull), text_fmt, logging.INFO),
+            ('console-json', lambda: logging.StreamHandler(devnull), json_fmt, logging.INFO),
+            ('file-text', lambda: logging.FileHandler(os.path.join(work_dir, 'text.log'), encoding='utf-8'),
+             text_fmt, logging.INFO),
+            ('file-json', lambda: logging.FileHandler(os.path.join(work_dir, 'json.log'), encoding='utf-8'),
+             json_fmt, logging.INFO),
+        ]
+
+        for name, make_handler, formatter, level in configurations:
+            logger.setLevel(level)
+            results[name] = {}
+            for style in CALL_STYLES:
+                handler = None
+                if make_handler is not None:
+                    handler = make_handler()
+                    handler.setFormatter(formatter)
+                    logger.addHandler(handler)
+                results[name][style] = _measure_calls(logger, style, records)
+                if handler is not None:
+                    logger.removeHandler(handler)
+                    handler.close()
+
+    return results
+
+
+# 메인 실행 함수
+def main():
+    parser = argparse.ArgumentParser(description="동기 vs 비동기 로깅 및 포맷터 벤치마크")
+    parser.add_argument('--suite', choices=['pipeline', 'formatter', 'all'], default='all',
+                        help="실행할 벤치마크 (pipeline: 동기/비동기 비교, formatter: 포맷터 records/sec)")
+    parser.add_argument('--records', type=int, default=50000, help="구성별로 기록할 로그 레코드 수")
+    parser.add_argument('--queue-size', type=int, default=10000, help="비동기 모드의 큐 크기")
+    args = parser.parse_args()
+
+    results = {}
+    if args.suite in ('pipeline', 'all'):
+        results['pipeline'] = run_benchmark(args.records, args.queue_size)
+    if args.suite in ('formatter', 'all'):
+        results['formatter'] = run_formatter_benchmark(args.records)
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
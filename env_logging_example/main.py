@@ -8,20 +8,31 @@
 - .env 파일에서 환경 변수 로딩 (LOG_LEVEL, APP_NAME)
 - logging 모듈을 통한 로그 설정 (콘솔 + 파일 출력)
 - 다양한 로그 레벨 메시지 출력 (INFO, DEBUG, ERROR)
+- LOG_ASYNC=true 설정 시 큐 기반 비동기 로깅 사용 (async_logging.py 참고)
+- LOG_FORMAT=json 설정 시 구조화 JSON 로그 출력 (json_logging.py 참고)
 
 변경 내역:
 - 2026-01-12 [김준서(C1098)]: 초기 버전 생성 (환경 변수 및 로깅 설정 실습)
+- 2026-10-18 [김준서(C1098)]: 선택적 비동기 로깅 모드 추가 (QueueHandler/QueueListener)
+- 2026-10-18 [김준서(C1098)]: JSON 로그 포맷 옵션 추가, 로그 메시지 f-string을 지연 포맷(%s)으로 변경
 """
 
 import os
 import logging
+from typing import Dict, Optional
 from dotenv import load_dotenv
 
+from async_logging import load_async_options, shutdown_async_logging, start_async_logging
+from json_logging import JsonFormatter, KeyValueTextFormatter
+
 
 # 로깅 설정 함수: 로그 레벨과 포맷을 설정하고 콘솔 및 파일 핸들러를 추가합니다.
 # Args: level_name (str) - 로그 레벨 문자열 (예: "DEBUG", "INFO")
+#       async_options (Dict) - 비동기 로깅 옵션 (기본값: None, 동기 방식 사용)
+#       log_format (str) - 로그 포맷 ("text" 또는 "json", 기본값: "text")
 # Returns: None
-def setup_logging(level_name: str) -> None:
+def setup_logging(level_name: str, async_options: Optional[Dict[str, any]] = None,
+                  log_format: str = "text") -> None:
     # 문자열 레벨("DEBUG") -> logging.DEBUG 변환 (없으면 INFO로 fallback)
     level = getattr(logging, level_name.upper(), logging.INFO)
     
@@ -30,11 +41,21 @@ def setup_logging(level_name: str) -> None:
     logger.setLevel(level)
     
     # 중복 핸들러 방지 (재실행 시 핸들러가 중복 추가되는 것을 방지)
+    shutdown_async_logging()
     if logger.handlers:
         logger.handlers.clear()
     
-    # 로그 포맷 설정: 시간 | 로그레벨 | 메시지
-    fmt = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s")
+    # 로그 포맷 설정: 시간 | 로그레벨 | 메시지 (json이면 한 줄 JSON 객체)
+    if log_format.lower() == "json":
+        fmt = JsonFormatter()
+    else:
+        # kv 헬퍼(info_kv 등)로 넘긴 필드도 메시지 뒤에 key=value로 출력
+        fmt = KeyValueTextFormatter("%(asctime)s | %(levelname)s | %(message)s")
+    
+    # 비동기 모드: 큐 핸들러만 루트 로거에 붙이고, 실제 I/O는 리스너 스레드에서 처리
+    if async_options is not None:
+        start_async_logging(logger, level, fmt, "app.log", async_options)
+        return
     
     # 콘솔 핸들러 생성 및 설정
     console_handler = logging.StreamHandler()
@@ -56,12 +77,13 @@ def main():
     # .env 파일에서 환경 변수 로딩
     load_dotenv()
     
-    # 환경 변수에서 LOG_LEVEL과 APP_NAME 읽기 (기본값: INFO, MyApp)
+    # 환경 변수에서 LOG_LEVEL, LOG_FORMAT, APP_NAME 읽기 (기본값: INFO, text, MyApp)
     log_level = os.getenv("LOG_LEVEL", "INFO")
+    log_format = os.getenv("LOG_FORMAT", "text")
     app_name = os.getenv("APP_NAME", "MyApp")
     
-    # 로깅 설정
-    setup_logging(log_level)
+    # 로깅 설정 (LOG_ASYNC=true이면 비동기 모드)
+    setup_logging(log_level, load_async_options(), log_format)
     
     # INFO 레벨 메시지 출력
     logging.info("앱 실행 시작")
@@ -75,8 +97,8 @@ def main():
     except ZeroDivisionError:
         logging.exception("예외 발생 예시")
     
-    # APP_NAME 출력
-    logging.info(f"APP_NAME={app_name}")
+    # APP_NAME 출력 (레벨이 꺼져 있으면 문자열 포맷 비용이 들지 않도록 %s 인자로 전달)
+    logging.info("APP_NAME=%s", app_name)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,176 @@
+"""
+async_logging 모듈 동작 테스트
+
+오버플로 정책(drop, sample), 배치 리스너, 크기 로테이션 핸들러의 크기 추적,
+종료(shutdown) 시 flush 순서와 버려진 로그 경고를 검증합니다.
+
+실행: python -m pytest env_logging_example
+"""
+
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+
+from async_logging import (
+    BatchFileHandler,
+    BatchingQueueListener,
+    BatchRotatingFileHandler,
+    OverflowQueueHandler,
+    shutdown_async_logging,
+    start_async_logging,
+)
+
+
+# 테스트용 로그 레코드 생성 헬퍼
+def _record(msg: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.makeLogRecord({
+        'msg': msg,
+        'levelno': level,
+        'levelname': logging.getLevelName(level),
+    })
+
+
+def _read_lines(path: str):
+    with open(path, encoding='utf-8') as f:
+        return f.read().splitlines()
+
+
+def test_drop_policy_counts_records_that_do_not_fit():
+    handler = OverflowQueueHandler(queue.Queue(maxsize=2), overflow='drop')
+
+    for i in range(5):
+        handler.handle(_record(f"r{i}"))
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_warning_records_are_never_dropped():
+    handler = OverflowQueueHandler(queue.Queue(maxsize=3), overflow='drop')
+    handler.handle(_record("info-1"))
+    handler.handle(_record("info-2"))
+
+    handler.handle(_record("warn", logging.WARNING))
+
+    assert handler.dropped == 0
+    assert [handler.queue.get_nowait().msg for _ in range(3)] == ["info-1", "info-2", "warn"]
+
+
+def test_sample_policy_keeps_one_in_n_above_watermark():
+    # 큐 크기 10, 기준선 80% -> 8개부터 샘플링 (5개 중 1개만 넣음)
+    handler = OverflowQueueHandler(queue.Queue(maxsize=10), overflow='sample', sample_rate=5)
+    for i in range(8):
+        handler.handle(_record(f"fill{i}"))
+
+    for i in range(10):
+        handler.handle(_record(f"s{i}"))
+
+    assert handler.queue.qsize() == 10
+    assert handler.dropped == 8
+
+
+def test_prepare_keeps_exception_text_out_of_message():
+    handler = OverflowQueueHandler(queue.Queue(), overflow='block')
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.getLogger("test").makeRecord(
+            "test", logging.ERROR, __file__, 1, "failed %s", ("job",), exc_info=sys.exc_info()
+        )
+
+    prepared = handler.prepare(record)
+
+    assert prepared.msg == "failed job"
+    assert prepared.args is None
+    assert prepared.exc_info is None
+    assert "ValueError: boom" in prepared.exc_text
+
+
+def test_listener_writes_all_records_and_supports_queue_join(tmp_path):
+    log_file = str(tmp_path / "app.log")
+    file_handler = BatchFileHandler(log_file, encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter("%(message)s"))
+    log_queue = queue.Queue()
+    queue_handler = OverflowQueueHandler(log_queue)
+    listener = BatchingQueueListener(
+        log_queue, file_handler, logger=logging.getLogger("test"), queue_handler=queue_handler,
+        batch_size=4, flush_interval=0.01,
+    )
+    listener.start()
+    try:
+        for i in range(10):
+            queue_handler.handle(_record(f"r{i}"))
+
+        # _monitor가 항목마다 task_done()을 호출해야 join()이 반환됨
+        joiner = threading.Thread(target=log_queue.join, daemon=True)
+        joiner.start()
+        joiner.join(timeout=2)
+        assert not joiner.is_alive()
+    finally:
+        listener.stop()
+        file_handler.close()
+
+    assert _read_lines(log_file) == [f"r{i}" for i in range(10)]
+
+
+def test_rotating_handler_buffers_until_flush_and_rotates_by_size(tmp_path):
+    log_file = str(tmp_path / "app.log")
+    handler = BatchRotatingFileHandler(log_file, maxBytes=200, backupCount=5, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    # 한 줄 = 한글 10자(30 bytes) + 개행 = 31 bytes
+    for _ in range(3):
+        handler.handle(_record("가" * 10))
+    assert os.path.getsize(log_file) == 0
+
+    handler.flush_now()
+    assert os.path.getsize(log_file) == 93
+
+    for _ in range(20):
+        handler.handle(_record("가" * 10))
+    handler.close()
+
+    files = sorted(os.listdir(tmp_path))
+    assert "app.log.1" in files
+    total = 0
+    for name in files:
+        size = os.path.getsize(tmp_path / name)
+        assert size < 200
+        total += size
+    assert total == 23 * 31
+
+
+def test_shutdown_flushes_queue_detaches_handler_and_reports_drops(tmp_path):
+    log_file = str(tmp_path / "app.log")
+    logger = logging.getLogger("test_async_shutdown")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener = start_async_logging(
+        logger, logging.INFO, logging.Formatter("%(message)s"), log_file,
+        {'queue_size': 1, 'overflow': 'drop'},
+    )
+    file_handler = listener.handlers[1]
+
+    # 파일 핸들러 락을 잡아 리스너를 첫 레코드에서 멈추게 한 뒤 큐(크기 1)를 넘치게 함
+    file_handler.acquire()
+    try:
+        logger.info("r0")
+        deadline = time.monotonic() + 2
+        while not listener.queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        for i in range(1, 5):
+            logger.info(f"r{i}")
+    finally:
+        file_handler.release()
+
+    shutdown_async_logging()
+
+    assert logger.handlers == []
+    assert _read_lines(log_file) == [
+        "r0",
+        "r1",
+        "오버플로 정책(drop)으로 로그 3개가 버려졌습니다.",
+    ]
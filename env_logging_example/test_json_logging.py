@@ -0,0 +1,123 @@
+"""
+json_logging 모듈 동작 테스트
+
+JsonFormatter 출력이 json.loads로 그대로 복원되는지(중복 키 없음), kv 헬퍼의 필드 전달과
+지연 평가, text 포맷에서의 kv 필드 출력을 검증합니다.
+
+실행: python -m pytest env_logging_example
+"""
+
+import json
+import logging
+
+import pytest
+
+from json_logging import JsonFormatter, KeyValueTextFormatter, debug_kv, info_kv
+
+
+# 포맷된 문자열을 모아두는 테스트용 핸들러
+class _ListHandler(logging.Handler):
+    def __init__(self, formatter: logging.Formatter):
+        super().__init__()
+        self.setFormatter(formatter)
+        self.lines = []
+
+    def emit(self, record: logging.LogRecord):
+        self.lines.append(self.format(record))
+
+
+@pytest.fixture
+def make_logger():
+    handlers = []
+
+    def _make(formatter: logging.Formatter, level: int = logging.INFO):
+        logger = logging.getLogger(f"test_json_logging.{len(handlers)}")
+        logger.setLevel(level)
+        logger.propagate = False
+        handler = _ListHandler(formatter)
+        logger.addHandler(handler)
+        handlers.append((logger, handler))
+        return logger, handler
+
+    yield _make
+    for logger, handler in handlers:
+        logger.removeHandler(handler)
+
+
+# JSON 문자열을 (키, 값) 쌍 리스트로 파싱 (중복 키가 있으면 그대로 드러나도록)
+def _pairs(line: str):
+    return json.loads(line, object_pairs_hook=list)
+
+
+def test_extra_fields_clashing_with_output_keys_are_prefixed(make_logger):
+    logger, handler = make_logger(JsonFormatter())
+
+    logger.info("hello", extra={'level': 'user', 'ts': 1, 'logger': 'x', 'request_id': 'abc'})
+
+    keys = [key for key, _ in _pairs(handler.lines[0])]
+    assert len(keys) == len(set(keys))
+    data = json.loads(handler.lines[0])
+    assert data['level'] == 'INFO'
+    assert data['message'] == 'hello'
+    assert data['field_level'] == 'user'
+    assert data['field_ts'] == 1
+    assert data['field_logger'] == 'x'
+    assert data['request_id'] == 'abc'
+
+
+def test_kv_fields_round_trip_including_logrecord_attribute_names(make_logger):
+    logger, handler = make_logger(JsonFormatter())
+
+    info_kv(logger, "scan", filename="a.py", name="n", lineno=3, args=[1], message="dup")
+
+    keys = [key for key, _ in _pairs(handler.lines[0])]
+    assert len(keys) == len(set(keys))
+    data = json.loads(handler.lines[0])
+    assert data['message'] == 'scan'
+    assert data['filename'] == 'a.py'
+    assert data['name'] == 'n'
+    assert data['lineno'] == 3
+    assert data['args'] == [1]
+    assert data['field_message'] == 'dup'
+
+
+def test_exception_is_a_separate_field(make_logger):
+    logger, handler = make_logger(JsonFormatter())
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed")
+
+    data = json.loads(handler.lines[0])
+    assert data['message'] == 'failed'
+    assert "ValueError: boom" in data['exc_info']
+
+
+def test_callable_fields_are_evaluated_only_when_enabled(make_logger):
+    logger, handler = make_logger(JsonFormatter(), level=logging.INFO)
+    calls = []
+
+    def expensive():
+        calls.append(1)
+        return "payload"
+
+    debug_kv(logger, "skipped", body=expensive)
+    assert calls == []
+    assert handler.lines == []
+
+    info_kv(logger, "kept", body=expensive)
+    assert calls == [1]
+    assert json.loads(handler.lines[0])['body'] == "payload"
+
+
+def test_text_formatter_renders_kv_fields(make_logger):
+    logger, handler = make_logger(KeyValueTextFormatter("%(levelname)s | %(message)s"))
+
+    info_kv(logger, "user_login", user_id=42, path="/api", note="two words")
+    logger.info("plain %s", "message")
+
+    assert handler.lines == [
+        'INFO | user_login user_id=42 path=/api note="two words"',
+        'INFO | plain message',
+    ]
@@ -11,15 +11,19 @@
 
 변경 내역:
 - 2026-01-12 [김준서(C1098)]: 초기 버전 생성 (짝수 제곱 제너레이터 실습)
+- 2026-10-18 [김준서(C1098)]: even_square_gen에 공용 계측 데코레이터 적용 (profiling_hooks)
 """
 
 import sys
 import time
 
+from profiling_hooks import instrument
+
 
 # 제너레이터 함수: 0 이상 n 미만의 정수 중 짝수만 제곱해서 하나씩 생성합니다.
 # Args: n (int) - 생성할 정수의 상한값 (n 미만)
 # Yields: int - 짝수의 제곱값을 하나씩 생성
+@instrument
 def even_square_gen(n):
     for i in range(n):
         if i % 2 == 0:
@@ -0,0 +1,328 @@
+"""
+공용 프로파일링 훅(hot-path 계측) 모듈
+
+이 모듈은 데코레이터 / 컨텍스트 매니저 하나로 함수의 호출 횟수, 실행 시간, 메모리 할당량을
+기록하는 공용 계측 계층을 제공합니다. 운영 중 hot path를 관찰하기 위한 것으로,
+even_square_generator.py / memory_profiling.py가 화면에 출력하는 리스트 vs 제너레이터 비교용
+측정(time.time(), tracemalloc)은 실습 내용 그 자체이므로 그대로 둡니다.
+
+주요 기능:
+- @instrument 데코레이터: 일반 함수와 제너레이터 함수 모두 지원
+- measure() 컨텍스트 매니저: 임의의 코드 블록 계측
+- 호출 횟수, wall / CPU 시간 히스토그램, 선택적 메모리 할당 변화량(tracemalloc) 기록
+  (CPU 시간은 time.thread_time()으로 측정하여 다른 스레드의 작업이 섞이지 않음)
+- 비활성화 상태에서는 플래그 확인 한 번 후 원래 함수를 그대로 호출 (오버헤드 거의 없음)
+- JSON 또는 Prometheus 텍스트 파일(textfile collector 형식)로 내보내기
+
+환경 변수:
+- PROFILE_HOOKS: "true"이면 import 시 계측 활성화 (기본값: false)
+- PROFILE_ALLOC: "true"이면 메모리 할당 변화량도 기록 (기본값: false)
+- PROFILE_EXPORT: 종료 시 결과를 저장할 파일 경로 (.prom이면 Prometheus, 그 외는 JSON)
+
+사용 예:
+    from profiling_hooks import instrument, measure
+
+    @instrument
+    def scan_file(filepath): ...
+
+    with measure("report"):
+        generate_report(violations)
+
+    PROFILE_HOOKS=true PROFILE_EXPORT=hotpaths.prom python security_scanner.py
+
+변경 내역:
+- 2026-10-18 [김준서(C1098)]: 초기 버전 생성 (공용 계측 데코레이터 / 컨텍스트 매니저 및 내보내기)
+- 2026-10-18 [김준서(C1098)]: CPU 시간을 process_time()에서 thread_time()으로 변경 (호출한 스레드 기준)
+"""
+
+import atexit
+import bisect
+import contextlib
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+
+# 히스토그램 버킷 상한값 (초 단위, 마지막 +Inf 버킷은 별도로 처리)
+HISTOGRAM_BUCKETS = [
+    0.000001, 0.00001, 0.0001, 0.0005, 0.001, 0.005,
+    0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0,
+]
+
+# 계측 활성화 여부 (데코레이터 래퍼가 매 호출마다 확인하는 유일한 값)
+_enabled = False
+_track_allocations = False
+
+# 함수 이름별 통계 및 동시 갱신 보호용 락
+_stats: Dict[str, "_Metric"] = {}
+_lock = threading.Lock()
+
+
+# 함수 하나의 누적 통계: 호출 횟수, wall / CPU 시간 합계와 히스토그램, 메모리 할당 변화량
+class _Metric:
+    __slots__ = ('calls', 'wall_sum', 'cpu_sum', 'wall_buckets', 'cpu_buckets',
+                 'alloc_sum', 'alloc_samples')
+
+    def __init__(self):
+        self.calls = 0
+        self.wall_sum = 0.0
+        self.cpu_sum = 0.0
+        # 버킷별 개수 (마지막 칸은 +Inf)
+        self.wall_buckets = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.cpu_buckets = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+        self.alloc_sum = 0
+        self.alloc_samples = 0
+
+
+# 값이 들어갈 히스토그램 버킷 인덱스를 찾는 함수
+# Args: value (float) - 측정값 (초)
+# Returns: int - 버킷 인덱스 (어느 상한값에도 들어가지 않으면 마지막 +Inf 인덱스)
+def _bucket_index(value: float) -> int:
+    return bisect.bisect_left(HISTOGRAM_BUCKETS, value)
+
+
+# 측정 결과 한 건을 통계에 기록하는 함수
+# Args: name (str) - 계측 대상 이름
+#       wall (float) - wall clock 시간 (초)
+#       cpu (float) - CPU 시간 (초)
+#       alloc (int) - 메모리 할당 변화량 (bytes, 측정하지 않았으면 None)
+def _record(name: str, wall: float, cpu: float, alloc: Optional[int]) -> None:
+    wall_index = _bucket_index(wall)
+    cpu_index = _bucket_index(cpu)
+    with _lock:
+        metric = _stats.get(name)
+        if metric is None:
+            metric = _stats[name] = _Metric()
+        metric.calls += 1
+        metric.wall_sum += wall
+        metric.cpu_sum += cpu
+        metric.wall_buckets[wall_index] += 1
+        metric.cpu_buckets[cpu_index] += 1
+        if alloc is not None:
+            metric.alloc_sum += alloc
+            metric.alloc_samples += 1
+
+
+# 현재 추적 중인 메모리 사용량을 반환하는 함수 (할당 추적이 꺼져 있으면 None)
+def _traced_memory() -> Optional[int]:
+    if _track_allocations and tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    return None
+
+
+# 계측을 활성화하는 함수
+# Args: track_allocations (bool) - tracemalloc으로 메모리 할당 변화량도 기록할지 여부 (기본값: False)
+def enable(track_allocations: bool = False) -> None:
+    global _enabled, _track_allocations
+    _track_allocations = track_allocations
+    if track_allocations and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _enabled = True
+
+
+# 계측을 비활성화하는 함수 (이미 기록된 통계는 유지)
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+
+# 기록된 통계를 모두 초기화하는 함수
+def reset() -> None:
+    with _lock:
+        _stats.clear()
+
+
+# 계측 컨텍스트 매니저: with 블록의 실행 시간과 메모리 변화량을 name으로 기록합니다.
+# Args: name (str) - 계측 대상 이름
+@contextlib.contextmanager
+def measure(name: str):
+    if not _enabled:
+        yield
+        return
+    mem_before = _traced_memory()
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        mem_after = _traced_memory()
+        alloc = mem_after - mem_before if mem_before is not None and mem_after is not None else None
+        _record(name, wall, cpu, alloc)
+
+
+# 제너레이터를 감싸서 첫 next()부터 종료(소진 또는 close)까지의 전체 수명을 한 번 측정하는 제너레이터
+# 값마다 시간을 재면 타이머 호출 비용이 측정 대상보다 커지므로, 시작과 끝에서만 시간을 잽니다.
+# (따라서 소비하는 쪽에서 보낸 시간도 포함되며, send()/throw()는 yield from으로 그대로 전달됩니다)
+# CPU 시간은 제너레이터를 시작한 스레드 기준이므로, 다른 스레드에서 이어서 소비하면 정확하지 않습니다.
+# Args: name (str) - 계측 대상 이름
+#       gen - 원본 제너레이터 객체
+def _timed_generator(name: str, gen):
+    mem_before = _traced_memory()
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        return (yield from gen)
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        gen.close()
+        mem_after = _traced_memory()
+        alloc = mem_after - mem_before if mem_before is not None and mem_after is not None else None
+        _record(name, wall, cpu, alloc)
+
+
+# 계측 데코레이터: 함수 호출마다 실행 시간과 메모리 변화량을 기록합니다.
+# 제너레이터 함수는 첫 값 요청부터 종료까지의 전체 수명을 한 번의 호출로 기록합니다.
+# @instrument 또는 @instrument("이름") 형태로 사용할 수 있습니다.
+# Args: name (str) - 계측 대상 이름 (기본값: 모듈명.함수명)
+def instrument(name=None):
+    if callable(name):
+        return instrument()(name)
+
+    def decorator(func):
+        module = func.__module__
+        if module == '__main__':
+            # 스크립트로 직접 실행해도 import 했을 때와 같은 이름으로 기록되도록 파일명을 사용
+            module = os.path.splitext(os.path.basename(inspect.getfile(func)))[0]
+        metric_name = name or f"{module}.{func.__qualname__}"
+
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def gen_wrapper(*args, **kwargs):
+                if not _enabled:
+                    return func(*args, **kwargs)
+                return _timed_generator(metric_name, func(*args, **kwargs))
+            return gen_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with measure(metric_name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+# 기록된 통계를 JSON 직렬화 가능한 딕셔너리로 반환하는 함수
+# Returns: Dict - {이름: {calls, wall/cpu 합계·평균·히스토그램, 메모리 변화량}}
+def snapshot() -> Dict[str, Dict[str, any]]:
+    bounds = [str(bound) for bound in HISTOGRAM_BUCKETS] + ['+Inf']
+    result = {}
+    with _lock:
+        for name, metric in sorted(_stats.items()):
+            entry = {
+                'calls': metric.calls,
+                'wall_seconds_sum': metric.wall_sum,
+                'wall_seconds_avg': metric.wall_sum / metric.calls,
+                'cpu_seconds_sum': metric.cpu_sum,
+                'cpu_seconds_avg': metric.cpu_sum / metric.calls,
+                'wall_histogram': dict(zip(bounds, metric.wall_buckets)),
+                'cpu_histogram': dict(zip(bounds, metric.cpu_buckets)),
+            }
+            if metric.alloc_samples:
+                entry['alloc_bytes_sum'] = metric.alloc_sum
+                entry['alloc_bytes_avg'] = metric.alloc_sum / metric.alloc_samples
+            result[name] = entry
+    return result
+
+
+# 파일을 임시 파일에 쓴 뒤 교체하는 함수 (수집기가 반쯤 쓰인 파일을 읽지 않도록 함)
+def _write_atomic(path: str, content: str) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+# 통계를 JSON 파일로 내보내는 함수
+# Args: path (str) - 저장할 파일 경로
+def export_json(path: str) -> None:
+    _write_atomic(path, json.dumps(snapshot(), ensure_ascii=False, indent=2) + '\n')
+
+
+# Prometheus 히스토그램 한 개의 텍스트 줄들을 만드는 함수
+# Args: metric (str) - 메트릭 이름
+#       label (str) - function 라벨 값
+#       buckets (List[int]) - 버킷별 개수
+#       total (float) - 측정값 합계
+#       count (int) - 측정 횟수
+# Returns: List[str] - 텍스트 줄 목록
+def _prometheus_histogram(metric: str, label: str, buckets: List[int], total: float, count: int) -> List[str]:
+    lines = []
+    cumulative = 0
+    for bound, bucket_count in zip(HISTOGRAM_BUCKETS + ['+Inf'], buckets):
+        cumulative += bucket_count
+        lines.append(f'{metric}_bucket{{function="{label}",le="{bound}"}} {cumulative}')
+    lines.append(f'{metric}_sum{{function="{label}"}} {total}')
+    lines.append(f'{metric}_count{{function="{label}"}} {count}')
+    return lines
+
+
+# 통계를 Prometheus 텍스트 형식으로 변환하는 함수
+# Returns: str - Prometheus exposition 형식 텍스트
+def to_prometheus() -> str:
+    with _lock:
+        items = [(name.replace('\\', '\\\\').replace('"', '\\"'), metric) for name, metric in sorted(_stats.items())]
+
+        lines = ['# HELP hotpath_calls_total Number of instrumented calls.',
+                 '# TYPE hotpath_calls_total counter']
+        lines += [f'hotpath_calls_total{{function="{label}"}} {metric.calls}' for label, metric in items]
+
+        lines += ['# HELP hotpath_wall_seconds Wall clock time per call.',
+                  '# TYPE hotpath_wall_seconds histogram']
+        for label, metric in items:
+            lines += _prometheus_histogram('hotpath_wall_seconds', label, metric.wall_buckets,
+                                           metric.wall_sum, metric.calls)
+
+        lines += ['# HELP hotpath_cpu_seconds CPU time per call.',
+                  '# TYPE hotpath_cpu_seconds histogram']
+        for label, metric in items:
+            lines += _prometheus_histogram('hotpath_cpu_seconds', label, metric.cpu_buckets,
+                                           metric.cpu_sum, metric.calls)
+
+        alloc_items = [(label, metric) for label, metric in items if metric.alloc_samples]
+        if alloc_items:
+            # 순 메모리 변화량은 음수가 될 수 있으므로 counter가 아닌 gauge로 내보냄
+            lines += ['# HELP hotpath_alloc_bytes Net traced memory delta summed across calls (may be negative).',
+                      '# TYPE hotpath_alloc_bytes gauge']
+            lines += [f'hotpath_alloc_bytes{{function="{label}"}} {metric.alloc_sum}'
+                      for label, metric in alloc_items]
+
+    return '\n'.join(lines) + '\n'
+
+
+# 통계를 Prometheus 텍스트 파일로 내보내는 함수 (node_exporter textfile collector용)
+# Args: path (str) - 저장할 파일 경로 (보통 .prom 확장자)
+def export_prometheus(path: str) -> None:
+    _write_atomic(path, to_prometheus())
+
+
+# 파일 확장자에 따라 JSON 또는 Prometheus 형식으로 내보내는 함수
+# Args: path (str) - 저장할 파일 경로 (.prom이면 Prometheus, 그 외는 JSON)
+def export(path: str) -> None:
+    if path.endswith('.prom'):
+        export_prometheus(path)
+    else:
+        export_json(path)
+
+
+# 문자열 환경 변수를 bool로 변환하는 헬퍼 함수
+def _env_bool(name: str) -> bool:
+    return os.getenv(name, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+# 환경 변수에 따라 import 시 계측을 활성화하고, 종료 시 내보내기를 등록
+if _env_bool("PROFILE_HOOKS"):
+    enable(track_allocations=_env_bool("PROFILE_ALLOC"))
+    _export_path = os.getenv("PROFILE_EXPORT")
+    if _export_path:
+        atexit.register(export, _export_path)
@@ -0,0 +1,273 @@
+"""
+AST 보안 검사기 벤치마크 프로그램
+
+이 프로그램은 시드 기반의 합성(synthetic) Python 코드 트리를 생성하고, 이를 대상으로
+security_scanner의 scan_file / scan_directory 성능을 단계별로 측정하는 기능을 제공합니다.
+
+주요 기능:
+- 파일 개수, 파일 크기 분포, 위험 함수 호출 밀도를 설정할 수 있는 합성 코퍼스 생성기
+- 단계별(read, parse, visit, report) 소요 시간 측정
+- 초당 처리 파일 수(files/sec) 및 최대 메모리(tracemalloc) 측정
+- 측정 결과를 JSON 형태로 출력 (단계별 성능 회귀 추적용)
+
+사용 예:
+    python scanner_benchmark.py --files 500 --mean-lines 200 --danger-density 0.05 --seed 42
+
+변경 내역:
+- 2026-10-18 [김준서(C1098)]: 초기 버전 생성 (합성 코퍼스 생성기 및 단계별 벤치마크)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from security_scanner import DANGEROUS_FUNCTIONS, EXCLUDED_DIRS, generate_report, scan_directory
+
+
+# 파일 크기 분포 종류
+SIZE_DISTRIBUTIONS = ['uniform', 'lognormal', 'fixed']
+
+# 위험하지 않은 일반 문장 템플릿 (value 변수를 가공하는 단순 연산)
+BENIGN_STATEMENTS = [
+    "value = value * 2 + 1",
+    "items.append(value)",
+    "value = len(items) + value",
+    "text = str(value).upper()",
+    "value = max(value, 0)",
+    "total = sum(items)",
+]
+
+
+# 파일 하나의 줄 수를 분포에 따라 결정하는 함수
+# Args: rng (random.Random) - 시드가 고정된 난수 생성기
+#       distribution (str) - 크기 분포 ('uniform', 'lognormal', 'fixed')
+#       mean_lines (int) - 파일당 평균 줄 수
+# Returns: int - 생성할 줄 수 (최소 1)
+def _pick_line_count(rng: random.Random, distribution: str, mean_lines: int) -> int:
+    if distribution == 'uniform':
+        lines = rng.randint(1, mean_lines * 2)
+    elif distribution == 'lognormal':
+        # 평균이 mean_lines가 되도록 mu를 보정 (sigma=1.0 고정, 긴 꼬리 분포)
+        sigma = 1.0
+        mu = max(0.0, math.log(mean_lines) - sigma ** 2 / 2)
+        lines = int(rng.lognormvariate(mu, sigma))
+    else:
+        lines = mean_lines
+    return max(1, lines)
+
+
+# 합성 Python 소스 코드 한 개를 생성하는 함수
+# Args: rng (random.Random) - 시드가 고정된 난수 생성기
+#       line_count (int) - 함수 본문에 들어갈 문장 수의 목표치
+#       danger_density (float) - 각 문장이 위험 함수 호출일 확률 (0.0 ~ 1.0)
+# Returns: tuple - (소스 코드 문자열, 포함된 위험 호출 개수)
+def _generate_source(rng: random.Random, line_count: int, danger_density: float):
+    lines = ['"""합성 벤치마크 모듈 (자동 생성)"""', '']
+    dangerous_count = 0
+    func_index = 0
+
+    # 8문장마다 새로운 함수를 열어 실제 코드와 비슷한 중첩 구조를 만듦
+    for i in range(line_count):
+        if i % 8 == 0:
+            if i > 0:
+                lines.append("    return value")
+                lines.append('')
+            lines.append(f"def func_{func_index}(value, items):")
+            lines.append("    text = ''")
+            lines.append("    total = 0")
+            func_index += 1
+
+        if rng.random() < danger_density:
+            lines.append(f"    value = {rng.choice(DANGEROUS_FUNCTIONS)}(text)")
+            dangerous_count += 1
+        else:
+            lines.append(f"    {rng.choice(BENIGN_STATEMENTS)}")
+
+    lines.append("    return value")
+    lines.append('')
+    return '\n'.join(lines), dangerous_count
+
+
+# 시드 기반 합성 코퍼스(Python 파일 트리)를 생성하는 함수
+# Args: output_dir (str) - 코퍼스를 생성할 디렉토리 경로
+#       num_files (int) - 생성할 파일 개수
+#       mean_lines (int) - 파일당 평균 문장 수
+#       distribution (str) - 파일 크기 분포 ('uniform', 'lognormal', 'fixed')
+#       danger_density (float) - 문장당 위험 함수 호출 확률
+#       files_per_dir (int) - 하위 디렉토리 하나에 담을 파일 수 (기본값: 50)
+#       seed (int) - 난수 시드 (같은 시드면 같은 코퍼스 생성)
+# Returns: Dict - 생성된 코퍼스 정보 (파일 수, 총 바이트, 위험 호출 수 등)
+def generate_corpus(output_dir: str, num_files: int = 200, mean_lines: int = 100,
+                    distribution: str = 'lognormal', danger_density: float = 0.02,
+                    files_per_dir: int = 50, seed: int = 0) -> Dict[str, any]:
+    if distribution not in SIZE_DISTRIBUTIONS:
+        raise ValueError(f"지원하지 않는 크기 분포입니다: {distribution} (가능: {SIZE_DISTRIBUTIONS})")
+    if not 0.0 <= danger_density <= 1.0:
+        raise ValueError(f"danger_density는 0.0 ~ 1.0 사이여야 합니다: {danger_density}")
+
+    rng = random.Random(seed)
+    total_bytes = 0
+    total_dangerous = 0
+
+    for index in range(num_files):
+        # 파일을 여러 하위 디렉토리에 나누어 저장 (os.walk 비용도 함께 측정되도록)
+        sub_dir = os.path.join(output_dir, f"pkg_{index // files_per_dir:04d}")
+        os.makedirs(sub_dir, exist_ok=True)
+
+        line_count = _pick_line_count(rng, distribution, mean_lines)
+        source, dangerous_count = _generate_source(rng, line_count, danger_density)
+
+        filepath = os.path.join(sub_dir, f"module_{index:05d}.py")
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(source)
+
+        total_bytes += len(source.encode('utf-8'))
+        total_dangerous += dangerous_count
+
+    return {
+        'directory': output_dir,
+        'files': num_files,
+        'total_bytes': total_bytes,
+        'expected_violations': total_dangerous,
+        'mean_lines': mean_lines,
+        'distribution': distribution,
+        'danger_density': danger_density,
+        'seed': seed,
+    }
+
+
+# scan_directory와 같은 제외 규칙으로 스캔 대상 Python 파일 수를 세는 함수
+# Args: directory (str) - 스캔할 디렉토리 경로
+# Returns: int - 스캔 대상 .py 파일 수
+def _count_scanned_files(directory: str) -> int:
+    count = 0
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+        count += sum(1 for file in files if file.endswith('.py'))
+    return count
+
+
+# 디렉토리를 한 번 스캔하면서 단계별 소요 시간을 측정하는 함수
+# Args: directory (str) - 스캔할 디렉토리 경로
+# Returns: tuple - (단계별 소요 시간 딕셔너리, 발견된 위반 개수, {'parse_errors', 'read_errors'} 오류 수)
+def _timed_scan(directory: str):
+    timings = {'read': 0.0, 'parse': 0.0, 'visit': 0.0}
+
+    # 스캔 중 scan_file이 출력하는 오류 메시지가 JSON 결과에 섞이거나 터미널 I/O 시간이 walk에 포함되지 않도록 버퍼로 돌림
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        violations = scan_directory(directory, timings)
+    scan_total = time.perf_counter() - start
+    errors = {key: timings.pop(key, 0) for key in ('parse_errors', 'read_errors')}
+
+    # 리포트 단계: 출력은 버퍼로 돌려 터미널 I/O 비용이 측정에 섞이지 않도록 함
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate_report(violations)
+    timings['report'] = time.perf_counter() - start
+
+    # 파일 탐색(os.walk) 등 단계에 포함되지 않은 나머지 시간
+    timings['walk'] = max(0.0, scan_total - timings['read'] - timings['parse'] - timings['visit'])
+    timings['scan_total'] = scan_total
+    return timings, len(violations), errors
+
+
+# 스캐너 벤치마크를 실행하고 결과를 딕셔너리로 반환하는 함수
+# Args: directory (str) - 스캔할 디렉토리 경로
+#       repeat (int) - 반복 측정 횟수 (기본값: 3, scan_total이 가장 짧은 실행의 단계별 값을 결과로 사용)
+#       measure_memory (bool) - tracemalloc으로 최대 메모리를 측정할지 여부 (기본값: True)
+# Returns: Dict - 단계별 시간, files/sec, 최대 메모리 등을 담은 결과
+def run_benchmark(directory: str, repeat: int = 3, measure_memory: bool = True) -> Dict[str, any]:
+    num_files = _count_scanned_files(directory)
+
+    # 반복 측정 후 scan_total이 가장 짧은 실행을 사용 (단계별 합계가 scan_total과 일치하도록 한 실행의 값을 그대로 사용)
+    runs: List[Dict[str, float]] = []
+    violation_count = 0
+    errors = {}
+    for _ in range(max(1, repeat)):
+        timings, violation_count, errors = _timed_scan(directory)
+        runs.append(timings)
+    phases = min(runs, key=lambda run: run['scan_total'])
+
+    # 메모리 측정은 tracemalloc 오버헤드가 시간 측정에 섞이지 않도록 별도 실행
+    peak_memory: Optional[int] = None
+    if measure_memory:
+        tracemalloc.start()
+        _timed_scan(directory)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    scan_total = phases['scan_total']
+    return {
+        'files': num_files,
+        'violations': violation_count,
+        'parse_errors': errors['parse_errors'],
+        'read_errors': errors['read_errors'],
+        'repeat': len(runs),
+        'phases_sec': {phase: round(value, 6) for phase, value in phases.items()},
+        'files_per_sec': round(num_files / scan_total, 2) if scan_total > 0 else None,
+        'peak_memory_bytes': peak_memory,
+    }
+
+
+# 명령행 인자를 파싱하는 함수
+def _parse_args():
+    parser = argparse.ArgumentParser(description="AST 보안 검사기 단계별 벤치마크")
+    parser.add_argument('--directory', help="기존 디렉토리를 스캔 (지정 시 합성 코퍼스를 생성하지 않음)")
+    parser.add_argument('--files', type=int, default=200, help="생성할 파일 개수")
+    parser.add_argument('--mean-lines', type=int, default=100, help="파일당 평균 문장 수")
+    parser.add_argument('--distribution', choices=SIZE_DISTRIBUTIONS, default='lognormal',
+                        help="파일 크기 분포")
+    parser.add_argument('--danger-density', type=float, default=0.02, help="문장당 위험 함수 호출 확률")
+    parser.add_argument('--seed', type=int, default=0, help="코퍼스 생성 난수 시드")
+    parser.add_argument('--repeat', type=int, default=3, help="반복 측정 횟수")
+    parser.add_argument('--no-memory', action='store_true', help="최대 메모리 측정 생략")
+    parser.add_argument('--keep', action='store_true', help="생성한 코퍼스를 삭제하지 않음")
+    parser.add_argument('--output', help="결과 JSON을 저장할 파일 경로 (기본값: 표준 출력)")
+    return parser.parse_args()
+
+
+# 메인 실행 함수
+def main():
+    args = _parse_args()
+
+    corpus = None
+    directory = args.directory
+    if directory is None:
+        directory = tempfile.mkdtemp(prefix='scanner_bench_')
+        corpus = generate_corpus(
+            directory,
+            num_files=args.files,
+            mean_lines=args.mean_lines,
+            distribution=args.distribution,
+            danger_density=args.danger_density,
+            seed=args.seed,
+        )
+
+    try:
+        result = run_benchmark(directory, repeat=args.repeat, measure_memory=not args.no_memory)
+        if corpus is not None:
+            result['corpus'] = corpus
+    finally:
+        if corpus is not None and not args.keep:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    output = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,11 +11,16 @@ AST 기반 자동 보안 검사기
 
 변경 내역:
 - 2026-01-12 [김준서(C1098)]: 초기 버전 생성 (AST 기반 보안 검사기)
+- 2026-10-18 [김준서(C1098)]: 단계별(읽기/파싱/방문) 시간 측정용 timings 인자 추가
+- 2026-10-18 [김준서(C1098)]: scan_file / scan_directory / generate_report에 공용 계측 데코레이터 적용
 """
 
 import ast
 import os
-from typing import List, Dict, Tuple
+import time
+from typing import List, Dict, Optional, Tuple
+
+from profiling_hooks import instrument
 
 
 # 위험한 함수 목록 정의
@@ -34,6 +39,9 @@ DANGEROUS_FUNCTIONS = [
     'input',  # 사용자 입력 관련
 ]
 
+# 디렉토리 스캔 시 제외할 하위 디렉토리 목록
+EXCLUDED_DIRS = ['.git', '__pycache__', 'venv', 'env']
+
 
 # AST 노드 방문자 클래스: 함수 호출을 탐색하고 위험 함수를 감지합니다.
 # ast.NodeVisitor를 상속받아 모든 Call 노드를 방문합니다.
@@ -81,44 +89,69 @@ class SecurityVisitor(ast.NodeVisitor):
             return ''
 
 
+# 단계별 소요 시간을 timings 딕셔너리에 누적하는 헬퍼 함수
+# Args: timings (Dict) - {단계명: 누적 초} 딕셔너리 (None이면 아무 것도 하지 않음)
+#       phase (str) - 단계명 ('read', 'parse', 'visit')
+#       start (float) - time.perf_counter()로 측정한 시작 시각
+# Returns: float - 현재 시각 (다음 단계의 시작 시각으로 사용)
+def _record_phase(timings: Optional[Dict[str, float]], phase: str, start: float) -> float:
+    now = time.perf_counter()
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + (now - start)
+    return now
+
+
 # 단일 파일을 분석하고 보안 위반을 찾는 함수
 # Args: filepath (str) - 분석할 파일 경로
+#       timings (Dict) - 단계별 소요 시간을 누적할 딕셔너리 (기본값: None, 측정 안 함)
+#                        구문 오류/읽기 오류가 나면 'parse_errors' / 'read_errors' 개수도 누적
 # Returns: List[Dict] - 발견된 보안 위반 목록
-def scan_file(filepath: str) -> List[Dict[str, any]]:
+@instrument
+def scan_file(filepath: str, timings: Optional[Dict[str, float]] = None) -> List[Dict[str, any]]:
     try:
+        start = time.perf_counter()
         with open(filepath, 'r', encoding='utf-8') as f:
             source_code = f.read()
+        start = _record_phase(timings, 'read', start)
         
         # AST 파싱
         tree = ast.parse(source_code, filename=filepath)
+        start = _record_phase(timings, 'parse', start)
         
         # 보안 검사기 생성 및 실행
         visitor = SecurityVisitor(filepath)
         visitor.visit(tree)
+        _record_phase(timings, 'visit', start)
         
         return visitor.violations
     except SyntaxError as e:
+        if timings is not None:
+            timings['parse_errors'] = timings.get('parse_errors', 0) + 1
         print(f"⚠️  구문 오류: {filepath} (줄 {e.lineno})")
         return []
     except Exception as e:
+        if timings is not None:
+            timings['read_errors'] = timings.get('read_errors', 0) + 1
         print(f"❌ 오류 발생: {filepath} - {str(e)}")
         return []
 
 
 # 디렉토리 내의 모든 Python 파일을 스캔하는 함수
 # Args: directory (str) - 스캔할 디렉토리 경로
+#       timings (Dict) - 단계별 소요 시간을 누적할 딕셔너리 (기본값: None, 측정 안 함)
 # Returns: List[Dict] - 모든 파일에서 발견된 보안 위반 목록
-def scan_directory(directory: str) -> List[Dict[str, any]]:
+@instrument
+def scan_directory(directory: str, timings: Optional[Dict[str, float]] = None) -> List[Dict[str, any]]:
     all_violations = []
     
     for root, dirs, files in os.walk(directory):
         # .git, __pycache__ 등 제외
-        dirs[:] = [d for d in dirs if d not in ['.git', '__pycache__', 'venv', 'env']]
+        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
         
         for file in files:
             if file.endswith('.py'):
                 filepath = os.path.join(root, file)
-                violations = scan_file(filepath)
+                violations = scan_file(filepath, timings)
                 all_violations.extend(violations)
     
     return all_violations
@@ -126,6 +159,7 @@ def scan_directory(directory: str) -> List[Dict[str, any]]:
 
 # 보안 위반 리포트를 생성하고 출력하는 함수
 # Args: violations (List[Dict]) - 발견된 보안 위반 목록
+@instrument
 def generate_report(violations: List[Dict[str, any]]):
 
     print("보안 검사 리포트")